@@ -1,7 +1,9 @@
-from typing import Dict, List
+from typing import Dict, Iterator, List
 from .stringed_instrument import ModularGridNoteCollection
 import re
 
+_MG_TOKEN_RE = re.compile(r'\[[^\]]*\]|\([^\)]*\)|"[^"]*"|<[^>]*>|(\S+)')
+
 def convert_modular_grid_shorthand_to_modular_grid_positions(shorthand_text: str) -> Dict[int, int]:
     """Takes in a string of the form 'X1 X2 ... XN' and turns it into a list of x y coordinates"""
     modular_grid_positions = {}
@@ -10,7 +12,36 @@ def convert_modular_grid_shorthand_to_modular_grid_positions(shorthand_text: str
             modular_grid_positions[i] = int(ele)
 
     return modular_grid_positions
-            
+
+def _check_outside_text(text: str, mg_shorthand: str):
+    """Raises a ValueError if text found between groups of mg_shorthand is not whitespace"""
+    if "(" in text or ")" in text:
+        raise ValueError("Unbalanced parenthesis in modular grid shorthand: " + mg_shorthand)
+    if text.strip():
+        raise ValueError("Unexpected text outside of a group in modular grid shorthand: " + mg_shorthand)
+
+def _iter_groups(mg_shorthand: str) -> Iterator[str]:
+    """Yields the text inside each parenthesized group of mg_shorthand"""
+    i = 0
+    while True:
+        start = mg_shorthand.find("(", i)
+        if start == -1:
+            _check_outside_text(mg_shorthand[i:], mg_shorthand)
+            return
+        _check_outside_text(mg_shorthand[i: start], mg_shorthand)
+        end = mg_shorthand.find(")", start)
+        if end == -1:
+            raise ValueError("Unbalanced parenthesis in modular grid shorthand: " + mg_shorthand)
+        yield mg_shorthand[start + 1: end]
+        i = end + 1
+
+def _iter_delimited_groups(mg_shorthand: str) -> Iterator[str]:
+    """Yields the text inside each (), [], <> or "" delimited group of mg_shorthand"""
+    for match in _MG_TOKEN_RE.finditer(mg_shorthand):
+        if match.group(1) is not None:
+            _check_outside_text(match.group(1), mg_shorthand)
+        # slicing to remove the delimiters
+        yield match.group()[1: -1]
 
 def generate_MGNCs_from_MG_shorthand(mg_shorthand: str) -> List[ModularGridNoteCollection]:
     """An example of mg_shorthand could be
@@ -18,12 +49,12 @@ def generate_MGNCs_from_MG_shorthand(mg_shorthand: str) -> List[ModularGridNoteC
             "(X 5 X 5 5 5) (X X 5 7 6 7) (X 3 5 4 5 X)"
 
     """
-    MGNCs = []
-    matches = re.findall(
-        '\[[^\]]*\]|\([^\)]*\)|"[^"]*"|\<[^\>]*\>|\S+', mg_shorthand
-    )
-    for match in matches:
-        # slicing to remove the parenthesis
-        MGNCs.append(ModularGridNoteCollection(convert_modular_grid_shorthand_to_modular_grid_positions(match[1: -1])))
-    return MGNCs
+    if any(c in mg_shorthand for c in '[<"'):
+        groups = _iter_delimited_groups(mg_shorthand)
+    else:
+        groups = _iter_groups(mg_shorthand)
+    return [
+        ModularGridNoteCollection(convert_modular_grid_shorthand_to_modular_grid_positions(group))
+        for group in groups
+    ]
 
@@ -1,9 +1,9 @@
-import numuse.converters
-import numuse.music
-from fractions import Fraction
-from .converters import generate_MGNCs_from_MG_shorthand
-
 if __name__ == "__main__":
+    # only the script entry point needs these, keep them off the library import path
+    import numuse.converters
+    import numuse.music
+    from fractions import Fraction
+    from .converters import generate_MGNCs_from_MG_shorthand
 
     b = 1
     # half
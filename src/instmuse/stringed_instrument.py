@@ -1,21 +1,22 @@
 from __future__ import annotations
-import numuse.tools
 import numuse.constants
 import numuse.notation
 import numuse.musical_system
 from typing import List, Tuple, Dict
 
+_DEFAULT_MS = numuse.musical_system.RBMS_Approximation(
+    440, numuse.constants.JUST_INTONATION_RATIOS, 2, 2 ** (1 / 12), 12
+)
+
 
 class Instrument:
     """A device which is inteded to create notes from a musical system"""
 
     def __init__(
         self,
-        musical_system=numuse.musical_system.RBMS_Approximation(
-            440, numuse.constants.JUST_INTONATION_RATIOS, 2, 2 ** (1 / 12), 12
-        ),
+        musical_system=None,
     ):
-        self.musical_system = musical_system
+        self.musical_system = musical_system if musical_system is not None else _DEFAULT_MS
 
 
 class StringedInstrument(Instrument):
@@ -26,9 +27,7 @@ class StringedInstrument(Instrument):
         self,
         string_interval_pattern: List[int],
         lowest_note,
-        musical_system=numuse.musical_system.RBMS_Approximation(
-            440, numuse.constants.JUST_INTONATION_RATIOS, 2, 2 ** (1 / 12), 12
-        ),
+        musical_system=None,
     ):
         super().__init__(musical_system)
         self.string_interval_pattern = string_interval_pattern
@@ -57,9 +56,7 @@ class ModularGridStringedInstrument(StringedInstrument):
         num_frets: int,
         string_interval_pattern: List[int],
         lowest_note: numuse.notation.Note,
-        musical_system=numuse.musical_system.RBMS_Approximation(
-            440, numuse.constants.JUST_INTONATION_RATIOS, 2, 2 ** (1 / 12), 12
-        ),
+        musical_system=None,
     ):
         super().__init__(string_interval_pattern, lowest_note, musical_system)
         self.num_frets = num_frets
@@ -103,12 +100,18 @@ class ModularGridNoteCollection(numuse.notation.NoteCollection):
     ):
         self.modular_grid_instrument = modular_grid_instrument
         self.modular_grid_positions = modular_grid_positions
-        self.modular_grid_labels = {}
+        self.modular_grid_labels = modular_grid_labels = {}
+        open_string_notes = modular_grid_instrument.open_string_notes
         temp_notes = set()
-        for string_pos, fret_pos in self.modular_grid_positions.items():
-            mg_note = self.modular_grid_instrument.open_string_notes[string_pos] + fret_pos
+        for string_pos, fret_pos in modular_grid_positions.items():
+            mg_note = open_string_notes[string_pos] + fret_pos
             temp_notes.add(
                     mg_note
             )
-            self.modular_grid_labels[string_pos] = numuse.tools.ranged_modulus_operator(mg_note.note)
-        super().__init__(temp_notes, duration, self.modular_grid_instrument.musical_system)
+            # same as numuse.tools.ranged_modulus_operator(mg_note.note), python's % is already non-negative
+            modular_grid_labels[string_pos] = mg_note.note % 12
+        super().__init__(frozenset(temp_notes), duration, self.modular_grid_instrument.musical_system)
+
+    def __hash__(self):
+        """Hash of the notes, they are frozen so this stays consistent with the inherited __eq__"""
+        return hash(self.notes)
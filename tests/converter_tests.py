@@ -1,6 +1,7 @@
 import unittest
 # Assumes a local install of strmuse
 from numuse.notation import Note, NoteCollection
+from instmuse.converters import generate_MGNCs_from_MG_shorthand
 
 class TestNote(unittest.TestCase):
 
@@ -26,5 +27,28 @@ class TestNoteCollection(unittest.TestCase):
         NC2 = NoteCollection({Note(4), Note(0), Note(7), Note(11)})
         self.assertEqual(NC1, NC2)
 
+class TestModularGridShorthand(unittest.TestCase):
+
+    def test_documented_example(self):
+        MGNCs = generate_MGNCs_from_MG_shorthand("(X 5 X 5 5 5) (X X 5 7 6 7) (X 3 5 4 5 X)")
+        self.assertEqual(
+            [MGNC.modular_grid_positions for MGNC in MGNCs],
+            [{1: 5, 3: 5, 4: 5, 5: 5}, {2: 5, 3: 7, 4: 6, 5: 7}, {1: 3, 2: 5, 3: 4, 4: 5}],
+        )
+
+    def test_unbalanced_group(self):
+        for mg_shorthand in ["(X 5", "X 5)", "(X 5) (X 3", "(X 5 [X 3]", "X 5) [X 3]"]:
+            with self.assertRaises(ValueError):
+                generate_MGNCs_from_MG_shorthand(mg_shorthand)
+
+    def test_stray_text(self):
+        for mg_shorthand in ["(X 5) 7", "7 (X 5)", "(X 5) 7 [X 3]"]:
+            with self.assertRaises(ValueError):
+                generate_MGNCs_from_MG_shorthand(mg_shorthand)
+
+    def test_bracket_fallback(self):
+        MGNCs = generate_MGNCs_from_MG_shorthand("(X 5) [X 3]")
+        self.assertEqual([MGNC.modular_grid_positions for MGNC in MGNCs], [{1: 5}, {1: 3}])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,21 @@
+import unittest
+# Assumes a local install of numuse
+from instmuse.stringed_instrument import ModularGridNoteCollection
+
+class TestModularGridNoteCollection(unittest.TestCase):
+
+    def test_equal_grids_hash_equally(self):
+        MGNC1 = ModularGridNoteCollection({1: 5, 3: 5, 4: 5, 5: 5})
+        MGNC2 = ModularGridNoteCollection({1: 5, 3: 5, 4: 5, 5: 5})
+        self.assertEqual(MGNC1, MGNC2)
+        self.assertEqual(hash(MGNC1), hash(MGNC2))
+        self.assertEqual(len({MGNC1, MGNC2}), 1)
+
+    def test_different_grids_unequal(self):
+        MGNC1 = ModularGridNoteCollection({1: 5, 3: 5, 4: 5, 5: 5})
+        MGNC2 = ModularGridNoteCollection({2: 5, 3: 7, 4: 6, 5: 7})
+        self.assertNotEqual(MGNC1, MGNC2)
+        self.assertEqual(len({MGNC1, MGNC2}), 2)
+
+if __name__ == '__main__':
+    unittest.main()